@@ -273,9 +273,25 @@ def copy_dataset(bq_client: bigquery.Client,
                  source_project, source_dataset,
                  target_project, target_dataset)
     tables = get_table_list(bq_client, source_project, source_dataset)
+    if skip_existing_tables:
+        # One listing of the target dataset
+        # instead of checking every table separately.
+        existing_tables = set(get_table_list(bq_client,
+                                             target_project, target_dataset))
+        for table in tables:
+            if table in existing_tables:
+                logging.warning("⚠️ Table %s.%s.%s already exists. "
+                                "Skipping it.",
+                                target_project, target_dataset, table)
+        tables = [t for t in tables if t not in existing_tables]
+        if not tables:
+            logging.info("All tables of `%s.%s` already exist in `%s.%s`. "
+                         "Nothing to copy.",
+                         source_project, source_dataset,
+                         target_project, target_dataset)
+            return
     source_tables = [f"{source_project}.{source_dataset}.{t}" for t in tables]
     target_tables = [f"{target_project}.{target_dataset}.{t}" for t in tables]
     load_tables(bq_client,
                 source_tables, target_tables, location,
-                skip_existing_tables=skip_existing_tables,
                 write_disposition=write_disposition)
@@ -14,6 +14,8 @@
 #
 """Cortex Test Harness functions."""
 
+import functools
+
 from google.cloud import bigquery
 
 from common.py_libs import bq_helper
@@ -21,7 +23,11 @@ from common.py_libs import bq_helper
 
 TEST_HARNESS_VERSION="5_0"
 
+_WORKLOAD_PATH_TABLE = str.maketrans({".": "__"})
+_LOCATION_TABLE = str.maketrans({"-": "_"})
+
 
+@functools.lru_cache(maxsize=256)
 def get_test_harness_dataset(workload_path: str,
                             target_dataset_type: str,
                             location: str) -> str:
@@ -42,12 +48,11 @@ def get_test_harness_dataset(workload_path: str,
     """
 
     # Dataset name will be lower-case, letters, numbers and underscores.
-    workload_prefix = workload_path.replace(".", "__")
-    location = location.replace("-", "_")
-    dataset_name = (f"{workload_prefix}__{target_dataset_type}__"
-                    f"{TEST_HARNESS_VERSION}__{location}")
-
-    return dataset_name.lower()
+    # TEST_HARNESS_VERSION is already lower-case.
+    workload_prefix = workload_path.lower().translate(_WORKLOAD_PATH_TABLE)
+    location = location.lower().translate(_LOCATION_TABLE)
+    return (f"{workload_prefix}__{target_dataset_type.lower()}__"
+            f"{TEST_HARNESS_VERSION}__{location}")
 
 
 def load_dataset_test_data(bq_client: bigquery.Client,
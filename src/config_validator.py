@@ -21,38 +21,90 @@ from typing import Union
 from common.py_libs import resource_validation_helper
 
 
-def _validate_googleads(cfg: dict) -> None:
-    """ Validate GoogleAds specific config attributes. """
+# Declarative shape of the 'marketing' config section.
+# Attributes listed here must be present and not None or "".
+# Workload sections are only checked when their deploy flag is set.
+_MARKETING_REQUIRED = ("deployGoogleAds", "deployCM360", "dataflowRegion")
+_GOOGLEADS_REQUIRED = ("deployCDC", "datasets", "lookbackDays")
+_CM360_REQUIRED = ("deployCDC", "dataTransferBucket", "datasets")
+_DATASETS_REQUIRED = ("cdc", "raw", "reporting")
+
+_MARKETING_SCHEMA = {
+    "required": _MARKETING_REQUIRED,
+    "workloads": {
+        "GoogleAds": {
+            "deploy_flag": "deployGoogleAds",
+            "required": _GOOGLEADS_REQUIRED,
+            "datasets": _DATASETS_REQUIRED,
+        },
+        "CM360": {
+            "deploy_flag": "deployCM360",
+            "required": _CM360_REQUIRED,
+            "datasets": _DATASETS_REQUIRED,
+        },
+    },
+}
+
+
+def _missing_attrs(section: dict, attrs: tuple) -> list:
+    """ Returns attributes that are missing in section or have empty values. """
+    # Not a truthiness test: False and 0 are valid values (e.g. deployCDC).
+    return [attr for attr in attrs if section.get(attr) in (None, "")]
+
+
+def _workload_schema_errors(marketing: dict, name: str) -> list:
+    """ Returns shape errors of a workload section as per _MARKETING_SCHEMA. """
+
+    schema = _MARKETING_SCHEMA["workloads"][name]
+    workload = marketing.get(name)
+    if not workload:
+        return [f"Missing 'marketing' '{name}' attribute in the config file."]
+    if not isinstance(workload, dict):
+        return [f"'marketing' '{name}' attribute must be an object."]
+
+    missing_attrs = _missing_attrs(workload, schema["required"])
+    if missing_attrs:
+        return [f"Config file is missing some {name} attributes or has "
+                f"empty values: {missing_attrs}"]
+
+    datasets = workload["datasets"]
+    if not isinstance(datasets, dict):
+        return [f"'marketing' '{name}' 'datasets' attribute "
+                "must be an object."]
+    missing_datasets_attrs = _missing_attrs(datasets, schema["datasets"])
+    if missing_datasets_attrs:
+        return [f"Config file is missing some {name} datasets attributes "
+                f"or has empty value: {missing_datasets_attrs}"]
 
-    logging.info("Validating configuration for GoogleAds...")
+    return []
 
-    googleads = cfg["marketing"]["GoogleAds"]
 
-    missing_googleads_attrs = []
-    for attr in ("deployCDC", "datasets", "lookbackDays"):
-        if googleads.get(attr) is None or googleads.get(attr) == "":
-            missing_googleads_attrs.append(attr)
+def _schema_errors(marketing: dict) -> list:
+    """ Returns shape errors of 'marketing' section as per _MARKETING_SCHEMA.
+
+    Only presence and emptiness of attributes are checked here.
+    Cloud resources are validated separately.
+    """
 
-    if missing_googleads_attrs:
-        raise ValueError(
-            "Config file is missing some GoogleAds attributes or has empty "
-            f"values: {missing_googleads_attrs}")
+    missing_marketing_attrs = _missing_attrs(marketing,
+                                             _MARKETING_SCHEMA["required"])
+    if missing_marketing_attrs:
+        return ["Config file is missing some Marketing attributes or "
+                f"has empty value: {missing_marketing_attrs}"]
 
-    datasets = googleads["datasets"]
-    missing_datasets_attrs = []
-    for attr in ("cdc", "raw", "reporting"):
-        if datasets.get(attr) is None or datasets.get(attr) == "":
-            missing_datasets_attrs.append(attr)
+    errors = []
+    for name, schema in _MARKETING_SCHEMA["workloads"].items():
+        if marketing[schema["deploy_flag"]]:
+            errors.extend(_workload_schema_errors(marketing, name))
+    return errors
 
-    if missing_datasets_attrs:
-        raise ValueError(
-            "Config file is missing some GoogleAds datasets attributes "
-            f"or has empty value: {missing_datasets_attrs} ")
 
-    source = cfg["projectIdSource"]
-    target = cfg["projectIdTarget"]
-    location = cfg["location"]
-    datasets = [
+def _dataset_constraints(
+    source: str, target: str, location: str, datasets: dict
+) -> list[resource_validation_helper.DatasetConstraints]:
+    """ Returns constraints for raw, cdc and reporting workload datasets. """
+
+    return [
         resource_validation_helper.DatasetConstraints(
             f'{source}.{datasets["raw"]}',
             True, True, location),
@@ -63,62 +115,63 @@ def _validate_googleads(cfg: dict) -> None:
             f'{target}.{datasets["reporting"]}',
             False, True, location)
         ]
-    if not resource_validation_helper.validate_resources([],
-                                                            datasets):
-        raise ValueError("Resource validation failed.")
-
-    logging.info("✅ Config file validated for GoogleAds and is looking good.")
-
-
-def _validate_cm360(cfg: dict) -> None:
-    """ Validate CM360 specific config attributes. """
-
-    logging.info("Validating Config file for CM360...")
 
-    cm360 = cfg["marketing"]["CM360"]
 
-    missing_cm360_attrs = []
-    for attr in ("deployCDC", "dataTransferBucket", "datasets"):
-        if cm360.get(attr) is None or cm360.get(attr) == "":
-            missing_cm360_attrs.append(attr)
+def _googleads_resources(
+    cfg: dict
+) -> tuple[list[resource_validation_helper.BucketConstraints],
+           list[resource_validation_helper.DatasetConstraints]]:
+    """ Returns GoogleAds specific cloud resources to validate. """
 
-    if missing_cm360_attrs:
-        raise ValueError("Config file is missing some CM360 attributes or "
-                         f"has empty value: {missing_cm360_attrs}")
+    googleads = cfg["marketing"]["GoogleAds"]
+    return [], _dataset_constraints(cfg["projectIdSource"],
+                                    cfg["projectIdTarget"],
+                                    cfg["location"],
+                                    googleads["datasets"])
 
-    datasets = cm360["datasets"]
-    missing_datasets_attrs = []
-    for attr in ("cdc", "raw", "reporting"):
-        if datasets.get(attr) is None or datasets.get(attr) == "":
-            missing_datasets_attrs.append(attr)
 
-    if missing_datasets_attrs:
-        raise ValueError(
-            "Config file is missing some CM360 datasets attributes "
-            f"or has empty value: {missing_datasets_attrs} ")
+def _cm360_resources(
+    cfg: dict
+) -> tuple[list[resource_validation_helper.BucketConstraints],
+           list[resource_validation_helper.DatasetConstraints]]:
+    """ Returns CM360 specific cloud resources to validate. """
 
-    source = cfg["projectIdSource"]
-    target = cfg["projectIdTarget"]
+    cm360 = cfg["marketing"]["CM360"]
     location = cfg["location"]
     buckets = [resource_validation_helper.BucketConstraints(
         cm360["dataTransferBucket"], True, location
     )]
-    datasets = [
-        resource_validation_helper.DatasetConstraints(
-            f'{source}.{datasets["raw"]}',
-            True, True, location),
-        resource_validation_helper.DatasetConstraints(
-            f'{source}.{datasets["cdc"]}',
-            True, True, location),
-        resource_validation_helper.DatasetConstraints(
-            f'{target}.{datasets["reporting"]}',
-            False, True, location)
-        ]
-    if not resource_validation_helper.validate_resources(buckets,
-                                                            datasets):
-        raise ValueError("Resource validation failed.")
+    return buckets, _dataset_constraints(cfg["projectIdSource"],
+                                         cfg["projectIdTarget"],
+                                         location,
+                                         cm360["datasets"])
+
+
+def _dedupe_constraints(
+    buckets: list[resource_validation_helper.BucketConstraints],
+    datasets: list[resource_validation_helper.DatasetConstraints]
+) -> tuple[list[resource_validation_helper.BucketConstraints],
+           list[resource_validation_helper.DatasetConstraints]]:
+    """ Merges constraints on the same resource, keeping the strictest. """
+
+    unique_buckets = {}
+    for bucket in buckets:
+        key = (bucket.name, bucket.in_location)
+        if key in unique_buckets:
+            unique_buckets[key].must_be_writable |= bucket.must_be_writable
+        else:
+            unique_buckets[key] = bucket
+
+    unique_datasets = {}
+    for dataset in datasets:
+        key = (dataset.full_name, dataset.location)
+        if key in unique_datasets:
+            unique_datasets[key].must_exists |= dataset.must_exists
+            unique_datasets[key].must_be_writable |= dataset.must_be_writable
+        else:
+            unique_datasets[key] = dataset
 
-    logging.info("✅ Config file validated for GoogleAds and is looking good.")
+    return list(unique_buckets.values()), list(unique_datasets.values())
 
 
 def validate(cfg: dict) -> Union[dict, None]:
@@ -141,67 +194,53 @@ def validate(cfg: dict) -> Union[dict, None]:
         logging.error("🛑 Missing 'marketing' values in the config file. 🛑")
         return None
 
-    # Marketing Attributes
-    missing_marketing_attr = []
-    for attr in ("deployGoogleAds", "deployCM360", "dataflowRegion"):
-        if marketing.get(attr) is None or marketing.get(attr) == "":
-            missing_marketing_attr.append(attr)
+    errors = _schema_errors(marketing)
+    if errors:
+        for error in errors:
+            logging.error("🛑 %s 🛑", error)
+        return None
 
-    if missing_marketing_attr:
-        logging.error(
-            "🛑 Config file is missing some Marketing attributes or "
-            "has empty value: %s. 🛑", missing_marketing_attr)
+    dataflow_region = marketing["dataflowRegion"]
+    cfg_location = cfg["location"]
+    region = dataflow_region.lower()
+    location = cfg_location.lower()
+    location_len = len(location)
+    if region != location and not (region.startswith(location) and
+                                   len(region) > location_len and
+                                   region[location_len] == "-"):
+        logging.error("🛑 Invalid `dataflowRegion`: `%s`. "
+                        "It's expected to be in `%s`. 🛑",
+                        dataflow_region, cfg_location)
         return None
 
-    # Google Ads
-    deploy_googleads = marketing.get("deployGoogleAds")
+    # Collect resources of all enabled workloads,
+    # so shared ones are validated only once.
+    buckets = []
+    datasets = []
+    deploy_googleads = marketing["deployGoogleAds"]
+    deploy_cm360 = marketing["deployCM360"]
     if deploy_googleads:
-        googleads = marketing.get("GoogleAds")
-        if not googleads:
-            logging.error(
-                "🛑 Missing 'marketing' 'GoogleAds' attribute "
-                "in the config file. 🛑")
-            return None
-        else:
-            try:
-                _validate_googleads(cfg)
-            except ValueError as e:
-                logging.error("🛑 GoogleAds config validation failed: %s 🛑",
-                              str(e))
-                return None
-            except Exception as e:  # pylint: disable=broad-except
-                logging.error("🛑 GoogleAds config validation failed. 🛑")
-                logging.error(e)
-                return None
-
-    # CM360
-    deploy_cm360 = marketing.get("deployCM360")
+        googleads_buckets, googleads_datasets = _googleads_resources(cfg)
+        buckets.extend(googleads_buckets)
+        datasets.extend(googleads_datasets)
     if deploy_cm360:
-        cm360 = marketing.get("CM360")
-        if not cm360:
-            logging.error(
-                "🛑 Missing 'marketing' 'CM360' attribute "
-                "in the config file. 🛑")
-            return None
-        else:
-            try:
-                _validate_cm360(cfg)
-            except ValueError as e:
-                logging.error("🛑 CM360 config validation failed: %s 🛑",
-                              str(e))
-                return None
-            except Exception as e:  # pylint: disable=broad-except
-                logging.error("🛑 CM360 config validation failed. 🛑")
-                logging.error(e)
+        cm360_buckets, cm360_datasets = _cm360_resources(cfg)
+        buckets.extend(cm360_buckets)
+        datasets.extend(cm360_datasets)
+
+    if buckets or datasets:
+        buckets, datasets = _dedupe_constraints(buckets, datasets)
+        logging.info("Validating 'marketing' cloud resources...")
+        try:
+            if not resource_validation_helper.validate_resources(buckets,
+                                                                 datasets):
+                logging.error("🛑 Marketing resource validation failed. 🛑")
                 return None
-
-    region = marketing["dataflowRegion"].lower()
-    location = cfg["location"].lower()
-    if region != location and not region.startswith(f"{location}-"):
-        logging.error("🛑 Invalid `dataflowRegion`: `%s`. "
-                        "It's expected to be in `%s`. 🛑",
-                        marketing["dataflowRegion"], cfg["location"])
-        return None
+        except Exception as e:  # pylint: disable=broad-except
+            logging.error("🛑 Marketing resource validation failed. 🛑")
+            logging.error(e)
+            return None
+        logging.info("✅ 'marketing' cloud resources are valid.")
 
     logging.info("✅ 'marketing' config validated successfully. Looks good.")
 
@@ -0,0 +1,205 @@
+# Copyright 2023 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for Marketing config validation."""
+
+import copy
+import pathlib
+import sys
+import unittest
+from unittest.mock import patch
+
+# Make sure common modules are in Python path,
+# the same way as when init_deployment_config.py loads the validator.
+_SRC_DIR = pathlib.Path(__file__).parent.parent
+sys.path.append(str(_SRC_DIR))
+sys.path.append(str(_SRC_DIR.joinpath("common")))
+
+# pylint:disable=wrong-import-position
+import config_validator
+
+_VALID_CONFIG = {
+    "deployMarketing": True,
+    "projectIdSource": "source-project",
+    "projectIdTarget": "target-project",
+    "location": "US",
+    "marketing": {
+        "deployGoogleAds": True,
+        "deployCM360": True,
+        "dataflowRegion": "us-central1",
+        "GoogleAds": {
+            "deployCDC": True,
+            "lookbackDays": 180,
+            "datasets": {
+                "cdc": "CDC_GoogleAds",
+                "raw": "RAW_GoogleAds",
+                "reporting": "REPORTING_GoogleAds"
+            }
+        },
+        "CM360": {
+            "deployCDC": True,
+            "dataTransferBucket": "cm360-bucket",
+            "datasets": {
+                "cdc": "CDC_CM360",
+                "raw": "RAW_CM360",
+                "reporting": "REPORTING_CM360"
+            }
+        }
+    }
+}
+
+
+@patch("common.py_libs.resource_validation_helper.validate_resources",
+       return_value=True)
+class TestValidate(unittest.TestCase):
+    """Tests config_validator.validate functionality."""
+
+    def setUp(self) -> None:
+        self.cfg = copy.deepcopy(_VALID_CONFIG)
+
+    def test_valid_config(self, validate_resources_mock):
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIs(result, self.cfg)
+        validate_resources_mock.assert_called_once()
+
+    def test_false_and_zero_values_are_accepted(self,
+                                                validate_resources_mock):
+        # given
+        self.cfg["marketing"]["GoogleAds"]["deployCDC"] = False
+        self.cfg["marketing"]["GoogleAds"]["lookbackDays"] = 0
+        self.cfg["marketing"]["CM360"]["deployCDC"] = False
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIs(result, self.cfg)
+        validate_resources_mock.assert_called_once()
+
+    def test_empty_value_is_rejected(self, validate_resources_mock):
+        # given
+        self.cfg["marketing"]["GoogleAds"]["datasets"]["cdc"] = ""
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIsNone(result)
+        validate_resources_mock.assert_not_called()
+
+    def test_missing_value_is_rejected(self, validate_resources_mock):
+        # given
+        del self.cfg["marketing"]["CM360"]["dataTransferBucket"]
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIsNone(result)
+        validate_resources_mock.assert_not_called()
+
+    def test_disabled_workload_is_not_validated(self,
+                                                validate_resources_mock):
+        # given
+        self.cfg["marketing"]["deployCM360"] = False
+        self.cfg["marketing"]["CM360"] = {"datasets": "not a dict"}
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIs(result, self.cfg)
+        buckets, datasets = validate_resources_mock.call_args[0]
+        self.assertEqual(buckets, [])
+        self.assertEqual(len(datasets), 3)
+
+    def test_non_dict_datasets_is_rejected(self, validate_resources_mock):
+        # given
+        self.cfg["marketing"]["GoogleAds"]["datasets"] = "RAW_GoogleAds"
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIsNone(result)
+        validate_resources_mock.assert_not_called()
+
+    def test_region_in_multi_region_is_accepted(self,
+                                                validate_resources_mock):
+        # given
+        self.cfg["marketing"]["dataflowRegion"] = "US-EAST4"
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIs(result, self.cfg)
+        validate_resources_mock.assert_called_once()
+
+    def test_region_with_location_prefix_is_rejected(
+            self, validate_resources_mock):
+        # given
+        self.cfg["marketing"]["dataflowRegion"] = "usx"
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIsNone(result)
+        validate_resources_mock.assert_not_called()
+
+    def test_shared_datasets_are_validated_once(self,
+                                                validate_resources_mock):
+        # given
+        self.cfg["marketing"]["CM360"]["datasets"] = copy.deepcopy(
+            self.cfg["marketing"]["GoogleAds"]["datasets"])
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIs(result, self.cfg)
+        buckets, datasets = validate_resources_mock.call_args[0]
+        self.assertEqual(len(buckets), 1)
+        self.assertEqual(len(datasets), 3)
+
+    def test_failed_resource_validation_is_rejected(
+            self, validate_resources_mock):
+        # given
+        validate_resources_mock.return_value = False
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIsNone(result)
+
+    def test_marketing_not_deployed_skips_validation(
+            self, validate_resources_mock):
+        # given
+        self.cfg["deployMarketing"] = False
+        del self.cfg["marketing"]
+
+        # when
+        result = config_validator.validate(self.cfg)
+
+        # then
+        self.assertIs(result, self.cfg)
+        validate_resources_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()